@@ -10,8 +10,16 @@ import shutil
 import sys
 import tempfile
 
+g_envPathsInitialized = False
+
 
 def initEnvPaths():
+    # Only extend the paths once per process, every sample and test module calls this at import time
+    global g_envPathsInitialized
+    if g_envPathsInitialized:
+        return
+    g_envPathsInitialized = True
+
     # Set PATH, and PYTHONPATH
     scriptToRuntimePath = f"../../_build/{platform.system().lower()}-x86_64/release"
     scriptdir = os.path.dirname(os.path.realpath(__file__))
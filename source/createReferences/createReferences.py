@@ -4,6 +4,7 @@
 
 # Python built-in
 import argparse
+import os
 import pathlib
 import sys
 
@@ -21,9 +22,9 @@ from pxr import Gf, Usd, UsdGeom
 def createComponentStage(args) -> str:
     """Create a stage with a 2x2x2 grouping of mesh cubes"""
     componentName = "Cube_2x2x2"
-    stageDir = pathlib.Path(args.path).parent
-    extension = pathlib.Path(args.path).suffix
-    stagePath = stageDir / str(componentName + extension)
+    stageDir, stageFileName = os.path.split(args.path)
+    extension = os.path.splitext(stageFileName)[1]
+    stagePath = os.path.join(stageDir, componentName + extension).replace(os.sep, "/")
 
     # Create a USD component stage in memory, ensuring that key metadata is set
     componentStage = Usd.Stage.CreateInMemory()
@@ -62,7 +63,7 @@ def createComponentStage(args) -> str:
     # Write the component stage to disk
     success = usdex.core.exportLayer(
         layer=componentStage.GetRootLayer(),
-        identifier=stagePath.as_posix(),
+        identifier=stagePath,
         authoringMetadata=common.usdUtils.getSamplesAuthoringMetadata(),
         comment=f"{componentName} component",
         fileFormatArgs=args.fileFormatArgs,
@@ -70,7 +71,7 @@ def createComponentStage(args) -> str:
     if not success:
         return ""
 
-    return stagePath.as_posix()
+    return stagePath
 
 
 def main(args):
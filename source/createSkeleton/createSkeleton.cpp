@@ -20,6 +20,7 @@
 #include <pxr/usd/usdSkel/cache.h>
 #include <pxr/usd/usdSkel/root.h>
 #include <pxr/usd/usdSkel/skeleton.h>
+#include <pxr/usd/usdSkel/skeletonQuery.h>
 #include <pxr/usd/usdSkel/utils.h>
 
 #include <iostream>
@@ -258,25 +259,28 @@ pxr::UsdSkelRoot createSkelMesh(
     ///////////////////////////////////////////////////
     // Compute extents for the SkelRoot and Skeleton //
     ///////////////////////////////////////////////////
-    pxr::VtVec3fArray extent;
-    std::vector<double> timesamples;
-
-    pxr::UsdGeomBoundable::ComputeExtentFromPlugins(skelRoot, pxr::UsdTimeCode::Default(), &extent);
-    skelRoot.GetExtentAttr().Set(pxr::VtValue(extent), pxr::UsdTimeCode::Default());
-
-    pxr::UsdGeomBoundable::ComputeExtentFromPlugins(skeleton, pxr::UsdTimeCode::Default(), &extent);
-    skeleton.GetExtentAttr().Set(pxr::VtValue(extent), pxr::UsdTimeCode::Default());
-
+    // A single skel cache provides the animation and skeleton queries for every time code
     pxr::UsdSkelCache skelCache;
+    pxr::UsdSkelSkeletonQuery skelQuery = skelCache.GetSkelQuery(skeleton);
     pxr::UsdSkelAnimQuery animQuery = skelCache.GetAnimQuery(animPrim);
+    std::vector<double> timesamples;
     animQuery.GetJointTransformTimeSamples(&timesamples);
-    for (double time : timesamples)
+    std::vector<pxr::UsdTimeCode> timeCodes = { pxr::UsdTimeCode::Default() };
+    timeCodes.insert(timeCodes.end(), timesamples.begin(), timesamples.end());
+
+    pxr::UsdAttribute skelRootExtentAttr = skelRoot.GetExtentAttr();
+    pxr::UsdAttribute skeletonExtentAttr = skeleton.GetExtentAttr();
+    pxr::VtVec3fArray extent;
+    pxr::VtMatrix4dArray jointTransforms;
+    for (const pxr::UsdTimeCode& timeCode : timeCodes)
     {
-        pxr::UsdGeomBoundable::ComputeExtentFromPlugins(skelRoot, pxr::UsdTimeCode(time), &extent);
-        skelRoot.GetExtentAttr().Set(pxr::VtValue(extent), pxr::UsdTimeCode(time));
+        pxr::UsdGeomBoundable::ComputeExtentFromPlugins(skelRoot, timeCode, &extent);
+        skelRootExtentAttr.Set(pxr::VtValue(extent), timeCode);
 
-        pxr::UsdGeomBoundable::ComputeExtentFromPlugins(skeleton, pxr::UsdTimeCode(time), &extent);
-        skeleton.GetExtentAttr().Set(pxr::VtValue(extent), pxr::UsdTimeCode(time));
+        // The skeleton extent is the extent of its joints, compute it from the cached skeleton query
+        skelQuery.ComputeJointSkelTransforms(&jointTransforms, timeCode);
+        pxr::UsdSkelComputeJointsExtent(jointTransforms, &extent);
+        skeletonExtentAttr.Set(pxr::VtValue(extent), timeCode);
     }
 
     return skelRoot;
@@ -23,6 +23,42 @@ g_boneSize = 100.0
 g_timeCodesPerSecond = 24
 g_endTimeCode = 48
 
+##############################
+#  Skinned mesh point/vertex and joint map:
+#
+#  2---j2---3
+#  |   |    |
+#  1---j1---4
+#  |   |    |
+#  0---j0---5
+##############################
+g_meshPoints = Vt.Vec3fArray(
+    [
+        (-g_boneSize, 0.0, -g_boneSize),
+        (-g_boneSize, 0.0, 0.0),
+        (-g_boneSize, 0.0, g_boneSize),
+        (g_boneSize, 0.0, g_boneSize),
+        (g_boneSize, 0.0, 0.0),
+        (g_boneSize, 0.0, -g_boneSize),
+    ]
+)
+
+# Indices for each quad
+g_meshFaceVertexIndices = Vt.IntArray([0, 1, 4, 5, 1, 2, 3, 4])
+
+# Face vertex count
+g_meshFaceVertexCounts = Vt.IntArray([4, 4])
+
+# Vertex normals
+g_meshNormals = Vt.Vec3fArray([(0.0, 1.0, 0.0)])
+g_meshNormalIndices = Vt.IntArray([0, 0, 0, 0, 0, 0])
+
+# Joint indices - vert to joint indices mapping
+g_meshJointIndices = Vt.IntArray([0, 1, 2, 2, 1, 0])
+
+# Joint weights - vert to joint weight mapping
+g_meshJointWeights = Vt.FloatArray([1, 1, 1, 1, 1, 1])
+
 
 def createAndBindAnimForSkel(skeleton: UsdSkel.Skeleton, animPrimPath: str, elbowMaxAngle: float, wristMaxAngle: float) -> UsdSkel.Animation:
     """
@@ -193,41 +229,15 @@ def createSkelMesh(parent: Usd.Prim, skelRootName: str = "skelRootGroup", initia
     ################
     meshPrimPath = skelRoot.GetPrim().GetPath().AppendChild(skelChildPrimNames[2])
 
-    ##############################
-    #  point/vertex and joint map:
-    #
-    #  2---j2---3
-    #  |   |    |
-    #  1---j1---4
-    #  |   |    |
-    #  0---j0---5
-    ##############################
-    points = [
-        (-g_boneSize, 0.0, -g_boneSize),
-        (-g_boneSize, 0.0, 0.0),
-        (-g_boneSize, 0.0, g_boneSize),
-        (g_boneSize, 0.0, g_boneSize),
-        (g_boneSize, 0.0, 0.0),
-        (g_boneSize, 0.0, -g_boneSize),
-    ]
-
-    # Indices for each quad
-    faceVertexIndices = [0, 1, 4, 5, 1, 2, 3, 4]
-
-    # Face vertex count
-    faceVertexCounts = [4, 4]
-
-    # Vertex normals
-    normals = [(0.0, 1.0, 0.0)]
-    normalIndices = [0, 0, 0, 0, 0, 0]
-    normalsPrimvarData = usdex.core.Vec3fPrimvarData(UsdGeom.Tokens.vertex, normals, normalIndices)
+    # The mesh topology and skinning data is constant, see g_meshPoints for the point/vertex and joint map
+    normalsPrimvarData = usdex.core.Vec3fPrimvarData(UsdGeom.Tokens.vertex, g_meshNormals, g_meshNormalIndices)
 
     mesh = usdex.core.definePolyMesh(
         stage=stage,
         path=meshPrimPath,
-        faceVertexCounts=faceVertexCounts,
-        faceVertexIndices=faceVertexIndices,
-        points=points,
+        faceVertexCounts=g_meshFaceVertexCounts,
+        faceVertexIndices=g_meshFaceVertexIndices,
+        points=g_meshPoints,
         normals=normalsPrimvarData,
         displayColor=usdex.core.Vec3fPrimvarData(UsdGeom.Tokens.constant, [(1, 0.5, 0)]),
     )
@@ -241,12 +251,10 @@ def createSkelMesh(parent: Usd.Prim, skelRootName: str = "skelRootGroup", initia
 
     rigidDeformation = False
     # Joint indices - vert to joint indices mapping
-    jointIndices = [0, 1, 2, 2, 1, 0]
-    binding.CreateJointIndicesPrimvar(rigidDeformation).Set(jointIndices)
+    binding.CreateJointIndicesPrimvar(rigidDeformation).Set(g_meshJointIndices)
 
     # Joint weights - vert to joint weight mapping
-    jointWeights = [1, 1, 1, 1, 1, 1]
-    binding.CreateJointWeightsPrimvar(rigidDeformation).Set(jointWeights)
+    binding.CreateJointWeightsPrimvar(rigidDeformation).Set(g_meshJointWeights)
 
     # GeomBindTransform - For skinning to apply correctly set the bind-time world space transforms of the prim
     binding.CreateGeomBindTransformAttr().Set(Gf.Matrix4d(1))
@@ -254,21 +262,22 @@ def createSkelMesh(parent: Usd.Prim, skelRootName: str = "skelRootGroup", initia
     #################################################
     # Compute extents for the SkelRoot and Skeleton #
     #################################################
-    extent = UsdGeom.Boundable.ComputeExtentFromPlugins(skelRoot, Usd.TimeCode.Default())
-    skelRoot.GetExtentAttr().Set(extent, Usd.TimeCode.Default())
-
-    extent = UsdGeom.Boundable.ComputeExtentFromPlugins(skeleton, Usd.TimeCode.Default())
-    skeleton.GetExtentAttr().Set(extent, Usd.TimeCode.Default())
-
+    # A single skel cache provides the animation and skeleton queries for every time code
     skelCache = UsdSkel.Cache()
+    skelQuery = skelCache.GetSkelQuery(skeleton)
     animQuery = skelCache.GetAnimQuery(animPrim)
-    timesamples = animQuery.GetJointTransformTimeSamples()
-    for time in timesamples:
-        extent = UsdGeom.Boundable.ComputeExtentFromPlugins(skelRoot, Usd.TimeCode(time))
-        skelRoot.GetExtentAttr().Set(extent, Usd.TimeCode(time))
-
-        extent = UsdGeom.Boundable.ComputeExtentFromPlugins(skeleton, Usd.TimeCode(time))
-        skeleton.GetExtentAttr().Set(extent, Usd.TimeCode(time))
+    timeCodes = [Usd.TimeCode.Default()] + [Usd.TimeCode(time) for time in animQuery.GetJointTransformTimeSamples()]
+
+    skelRootExtentAttr = skelRoot.GetExtentAttr()
+    skeletonExtentAttr = skeleton.GetExtentAttr()
+    for timeCode in timeCodes:
+        extent = UsdGeom.Boundable.ComputeExtentFromPlugins(skelRoot, timeCode)
+        skelRootExtentAttr.Set(extent, timeCode)
+
+        # The skeleton extent is the extent of its joints, compute it from the cached skeleton query
+        jointTransforms = skelQuery.ComputeJointSkelTransforms(timeCode)
+        extent = UsdSkel.ComputeJointsExtent(jointTransforms)
+        skeletonExtentAttr.Set(extent, timeCode)
 
     return skelRoot
 
@@ -22,8 +22,6 @@ int main(int argc, char* argv[])
 {
     samples::Args args = samples::parseCommonOptions(argc, argv, "createStage", "Creates a stage using the OpenUSD Exchange SDK");
 
-    usdex::core::activateDiagnosticsDelegate();
-
     std::cout << "Stage path: " << args.stagePath << std::endl;
 
     // Create/overwrite a USD stage, ensuring that key metadata is set
@@ -42,6 +40,9 @@ int main(int argc, char* argv[])
         return -1;
     }
 
+    // Route Tf diagnostics through the OpenUSD Exchange SDK delegate once the stage has been created
+    usdex::core::activateDiagnosticsDelegate();
+
     // Get the default prim
     pxr::UsdPrim defaultPrim = stage->GetDefaultPrim();
 
@@ -21,7 +21,6 @@ from pxr import Tf, Usd, UsdGeom, UsdLux
 def main(args):
     print(f"Stage path: {args.path}")
 
-    usdex.core.activateDiagnosticsDelegate()
     try:
         # Create/overwrite a USD stage, ensuring that key metadata is set
         # NOTE: UsdGeom.GetFallbackUpAxis() is typically set to UsdGeom.Tokens.y
@@ -42,6 +41,9 @@ def main(args):
         print("Error creating stage, exiting")
         sys.exit(-1)
 
+    # Route Tf diagnostics through the OpenUSD Exchange SDK delegate once the stage has been created
+    usdex.core.activateDiagnosticsDelegate()
+
     # Get the default prim
     defaultPrim = stage.GetDefaultPrim()
 
@@ -27,9 +27,10 @@ void createRocket(pxr::UsdStageRefPtr stage)
     pxr::GfTransform transform;
 
     // Create Xform prim with an initial transform
-    pxr::TfTokenVector validTokens = usdex::core::getValidChildNames(stage->GetDefaultPrim(), std::vector<std::string>{ "rocket" });
+    pxr::UsdPrim defaultPrim = stage->GetDefaultPrim();
+    pxr::TfTokenVector validTokens = usdex::core::getValidChildNames(defaultPrim, std::vector<std::string>{ "rocket" });
     transform.SetTranslation(pxr::GfVec3d(0, 0, -300));
-    pxr::UsdGeomXform xformPrim = usdex::core::defineXform(stage->GetDefaultPrim(), validTokens[0], transform);
+    pxr::UsdGeomXform xformPrim = usdex::core::defineXform(defaultPrim, validTokens[0], transform);
 
     ///////////////////////////////////
     // Create cylindrical rocket tube
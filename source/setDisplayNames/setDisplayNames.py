@@ -23,9 +23,10 @@ def createRocket(stage):
     transform = Gf.Transform()
 
     # Create Xform prim with an initial transform
-    validTokens = usdex.core.getValidChildNames(stage.GetDefaultPrim(), ["rocket"])
+    defaultPrim = stage.GetDefaultPrim()
+    validTokens = usdex.core.getValidChildNames(defaultPrim, ["rocket"])
     transform.SetTranslation(Gf.Vec3d(0, 0, -300))
-    xformPrim = usdex.core.defineXform(stage.GetDefaultPrim(), validTokens[0], transform)
+    xformPrim = usdex.core.defineXform(defaultPrim, validTokens[0], transform)
 
     #################################
     # Create cylindrical rocket tube
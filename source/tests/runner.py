@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+
+# Run the test modules in parallel, one worker process per module
+#
+# This is an opt-in alternative to `repo test` for faster local iteration. It must be run from the repository root with
+# the samples runtime environment, for example:
+#   ./python.sh source/tests/runner.py
+#   ./python.sh source/tests/runner.py testCreateCameras testCreateLights
+
+# Python built-in
+import concurrent.futures
+import io
+import os
+import sys
+import unittest
+
+# Make the samples and the test utilities importable in this process and in every worker process
+g_testsDir = os.path.dirname(os.path.abspath(__file__))
+for path in (os.path.dirname(g_testsDir), g_testsDir):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+# These modules both run their sample against a relative stage path, which copies textures into the repository root
+# "textures" directory, and then remove that directory. It is shared rather than named per process, so they must not overlap
+g_serialModules = ["testCreateLights", "testCreateMaterials"]
+
+
+def runModules(moduleNames):
+    stream = io.StringIO()
+    suite = unittest.defaultTestLoader.loadTestsFromNames(moduleNames)
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    return result.wasSuccessful(), stream.getvalue()
+
+
+def main(moduleNames):
+    if not moduleNames:
+        moduleNames = sorted(f[:-3] for f in os.listdir(g_testsDir) if f.startswith("test") and f.endswith(".py"))
+
+    jobs = [[name] for name in moduleNames if name not in g_serialModules]
+    serialModules = [name for name in moduleNames if name in g_serialModules]
+    if serialModules:
+        jobs.append(serialModules)
+
+    # Each module runs in a worker process rather than a thread. The relative stage paths written to the repository root are
+    # named by process id, so only separate processes keep them apart. Each module also gets its own USD layer registry
+    success = True
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max(1, min(len(jobs), os.cpu_count() or 1))) as executor:
+        for jobSuccess, output in executor.map(runModules, jobs):
+            print(output)
+            success = success and jobSuccess
+
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
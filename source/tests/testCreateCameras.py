@@ -2,11 +2,6 @@
 # SPDX-License-Identifier: MIT
 #
 
-# Python built-in
-import pathlib
-import tempfile
-import unittest
-
 # Internal imports
 import common.sysUtils
 
@@ -14,23 +9,28 @@ common.sysUtils.initEnvPaths()
 
 import usdex.core
 import utils.fileFormat
-import utils.shell
-from pxr import Usd, UsdGeom
+from pxr import Sdf, Usd, UsdGeom
 from utils.BaseTestCase import BaseTestCase
 
 
 class CreateCamerasTestCase(BaseTestCase):
     def _checkStageContents(self, stagePath, telephotoCameraName, wideCameraName):
-        self.runAssetValidator(stagePath)
-
-        stage = Usd.Stage.Open(stagePath)
+        validator = self.startAssetValidator(stagePath)
+
+        # Only populate the cameras under the default prim
+        layer = Sdf.Layer.FindOrOpen(stagePath)
+        self.assertTrue(layer)
+        self.assertTrue(layer.defaultPrim)
+        defaultPrimPath = Sdf.Path.absoluteRootPath.AppendChild(layer.defaultPrim)
+        mask = Usd.StagePopulationMask().Add(defaultPrimPath.AppendChild(telephotoCameraName)).Add(defaultPrimPath.AppendChild(wideCameraName))
+        stage = Usd.Stage.OpenMasked(layer, mask)
         self.assertTrue(stage)
 
         defaultPrim = stage.GetDefaultPrim()
         self.assertTrue(defaultPrim)
 
         # Check the telephoto camera existence, translation, and other properties
-        prim = stage.GetPrimAtPath(defaultPrim.GetPath().AppendChild(telephotoCameraName))
+        prim = defaultPrim.GetChild(telephotoCameraName)
         self.assertTrue(prim)
         typedPrim = UsdGeom.Camera(prim)
         self.assertTrue(typedPrim)
@@ -41,7 +41,7 @@ class CreateCamerasTestCase(BaseTestCase):
         self.assertAlmostEqual(typedPrim.GetFStopAttr().Get(), 1.4)
 
         # Check the wide camera existence, translation, and other properties
-        prim = stage.GetPrimAtPath(defaultPrim.GetPath().AppendChild(wideCameraName))
+        prim = defaultPrim.GetChild(wideCameraName)
         self.assertTrue(prim)
         typedPrim = UsdGeom.Camera(prim)
         self.assertTrue(typedPrim)
@@ -51,34 +51,32 @@ class CreateCamerasTestCase(BaseTestCase):
         self.assertAlmostEqual(translation.GetLength() / focusDistance, 1, 0)
         self.assertAlmostEqual(typedPrim.GetFStopAttr().Get(), 32)
 
+        self.waitAssetValidator(validator)
+
         stage = None
+        layer = None
 
     def _runSampleOptions(self, script, programPath):
-        with tempfile.TemporaryDirectory() as tempDirStr:
-            tempDir = pathlib.Path(tempDirStr)
-            argsRuns = [
-                (pathlib.Path(tempDir / "test_stage.usdc").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage.usda").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage_binary.usd").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage_text.usd").as_posix(), "--usda"),
-            ]
-            telephotoCameraNames = ["telephotoCamera", "telephotoCamera_1"]
-            wideCameraNames = ["wideCamera", "wideCamera_1"]
-
+        tempDirStr = self.makeTempDir().as_posix()
+        argsRuns = [
+            (f"{tempDirStr}/test_stage.usdc", None),
+            (f"{tempDirStr}/test_stage.usda", None),
+            (f"{tempDirStr}/test_stage_binary.usd", None),
+            (f"{tempDirStr}/test_stage_text.usd", "--usda"),
+        ]
+        telephotoCameraNames = ["telephotoCamera", "telephotoCamera_1"]
+        wideCameraNames = ["wideCamera", "wideCamera_1"]
+
+        # The stages are written concurrently, and each run is checked before the next run adds to them
+        for idx in range(len(telephotoCameraNames)):
+            self.runSampleOnStages(script, programPath, argsRuns)
             for args in argsRuns:
-                for idx in range(len(telephotoCameraNames)):
-                    if args[1]:
-                        return_code, output = utils.shell.run_shell_script(script, programPath, "-p", args[0], args[1])
-                    else:
-                        return_code, output = utils.shell.run_shell_script(script, programPath, "-p", args[0])
-
-                    self.assertEqual(return_code, 0, output)
-                    self._checkStageContents(args[0], telephotoCameraNames[idx], wideCameraNames[idx])
-                    utils.fileFormat.checkLayerFormat(self, args[0], args[1])
-
-            # Test invalid options
-            return_code, output = utils.shell.run_shell_script(script, programPath, "-p", pathlib.Path(tempDir / "test_stage.usdc").as_posix(), "-a")
-            self.assertEqual(return_code, 2)
+                self._checkStageContents(args[0], telephotoCameraNames[idx], wideCameraNames[idx])
+        for args in argsRuns:
+            utils.fileFormat.checkLayerFormat(self, args[0], args[1])
+
+        # Test invalid options
+        self.assertInvalidOptions(script, programPath, f"{tempDirStr}/test_stage.usdc")
 
     def testCppCreateCameras(self):
         self._runSampleOptions("run", "createCameras")
@@ -3,10 +3,9 @@
 #
 
 # Python built-in
+import os
 import pathlib
 import shutil
-import tempfile
-import unittest
 
 # Internal imports
 import common.sysUtils
@@ -14,8 +13,7 @@ import common.sysUtils
 common.sysUtils.initEnvPaths()
 
 import utils.fileFormat
-import utils.shell
-from pxr import Usd, UsdLux
+from pxr import Sdf
 from utils.BaseTestCase import BaseTestCase
 
 
@@ -29,76 +27,81 @@ class CreateLightsTestCase(BaseTestCase):
     # - it runs properly with or without an existing stage
 
     def _checkStageContents(self, stagePath, rectLightPrimName, domeLightPrimName):
-        self.runAssetValidator(stagePath)
+        validator = self.startAssetValidator(stagePath)
 
-        stage = Usd.Stage.Open(stagePath)
-        self.assertTrue(stage)
+        # The lights are authored directly in the root layer, so their specs can be checked without composing a stage
+        layer = Sdf.Layer.FindOrOpen(stagePath)
+        self.assertTrue(layer)
 
-        defaultPrim = stage.GetDefaultPrim()
-        self.assertTrue(defaultPrim)
+        self.assertTrue(layer.defaultPrim)
+        defaultPrimSpec = layer.GetPrimAtPath(Sdf.Path.absoluteRootPath.AppendChild(layer.defaultPrim))
+        self.assertTrue(defaultPrimSpec)
 
         # Check the rectLight
-        prim = stage.GetPrimAtPath(defaultPrim.GetPath().AppendChild(rectLightPrimName))
-        self.assertTrue(prim)
-        typedPrim = UsdLux.RectLight(prim)
-        self.assertTrue(typedPrim)
-        self.assertIsInstance(typedPrim, UsdLux.RectLight)
+        primSpec = defaultPrimSpec.nameChildren.get(rectLightPrimName)
+        self.assertTrue(primSpec)
+        self.assertEqual(primSpec.typeName, "RectLight")
 
         # Check the domeLight
-        prim = stage.GetPrimAtPath(defaultPrim.GetPath().AppendChild(domeLightPrimName))
-        self.assertTrue(prim)
-        typedPrim = UsdLux.DomeLight(prim)
-        self.assertTrue(typedPrim)
-        self.assertIsInstance(typedPrim, UsdLux.DomeLight)
+        primSpec = defaultPrimSpec.nameChildren.get(domeLightPrimName)
+        self.assertTrue(primSpec)
+        self.assertEqual(primSpec.typeName, "DomeLight")
 
         # Check the existance of the domelight texture
-        textureFilePath = typedPrim.GetTextureFileAttr().Get()
-        textureFilePathFromStage = pathlib.Path(stagePath).parent / pathlib.Path(textureFilePath.path)
+        textureFileSpec = primSpec.attributes.get("inputs:texture:file")
+        self.assertTrue(textureFileSpec)
+        textureFilePath = textureFileSpec.default
+        textureFilePathFromStage = pathlib.Path(stagePath).parent / textureFilePath.path
         self.assertTrue(len(textureFilePath.path) > 0)
         self.assertTrue(textureFilePathFromStage.exists())
 
-        stage = None
+        self.waitAssetValidator(validator)
 
-    def _runSampleOptions(self, script, programPath):
-        with tempfile.TemporaryDirectory() as tempDirStr:
-            tempDir = pathlib.Path(tempDirStr)
-            argsRuns = [
-                (pathlib.Path(tempDir / "test_stage.usdc").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage.usda").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage_binary.usd").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage_text.usd").as_posix(), "--usda"),
-            ]
-            rectLightNames = ["rectLight", "rectLight_1"]
-            domeLightNames = ["domeLight", "domeLight_1"]
+        layer = None
 
+    def _runSampleOptions(self, script, programPath):
+        tempDirStr = self.makeTempDir().as_posix()
+        # Each stage gets its own directory so the concurrent runs don't copy the dome light texture over each other
+        argsRuns = [
+            (f"{tempDirStr}/usdc/test_stage.usdc", None),
+            (f"{tempDirStr}/usda/test_stage.usda", None),
+            (f"{tempDirStr}/binary/test_stage_binary.usd", None),
+            (f"{tempDirStr}/text/test_stage_text.usd", "--usda"),
+        ]
+        rectLightNames = ["rectLight", "rectLight_1"]
+        domeLightNames = ["domeLight", "domeLight_1"]
+
+        # The stages are written concurrently, and each run is checked before the next run adds to them
+        for idx in range(len(rectLightNames)):
+            self.runSampleOnStages(script, programPath, argsRuns)
             for args in argsRuns:
-                for idx in range(len(rectLightNames)):
-                    if args[1]:
-                        return_code, output = utils.shell.run_shell_script(script, programPath, "-p", args[0], args[1])
-                    else:
-                        return_code, output = utils.shell.run_shell_script(script, programPath, "-p", args[0])
-
-                    self.assertEqual(return_code, 0, output)
-                    self._checkStageContents(args[0], rectLightNames[idx], domeLightNames[idx])
-                    utils.fileFormat.checkLayerFormat(self, args[0], args[1])
-
-            # Test relative path calculation in the program.  These pollute the repo, but they clean up after themselves
-            localStage = "local_test_stage.usdc"
-            return_code, output = utils.shell.run_shell_script(script, programPath, "-p", localStage)
+                self._checkStageContents(args[0], rectLightNames[idx], domeLightNames[idx])
+        for args in argsRuns:
+            utils.fileFormat.checkLayerFormat(self, args[0], args[1])
+
+        # Test relative path calculation in the program.  These pollute the repo, but they clean up after themselves, even on failure
+        # The stage and directory names include the process id so that concurrent test processes don't collide
+        localDirectory = f"local_directory_{os.getpid()}"
+        localStage = f"local_test_stage_{os.getpid()}.usdc"
+        try:
+            return_code, output = self.runSample(script, programPath, "-p", localStage)
             self.assertEqual(return_code, 0, output)
             self._checkStageContents(localStage, rectLightNames[0], domeLightNames[0])
-            pathlib.Path.unlink(pathlib.Path(localStage))
-            shutil.rmtree("textures")
-
-            localStage = "local_directory/test_stage.usdc"
-            return_code, output = utils.shell.run_shell_script(script, programPath, "-p", localStage)
+        finally:
+            if os.path.exists(localStage):
+                os.unlink(localStage)
+            shutil.rmtree("textures", ignore_errors=True)
+
+        localStage = f"{localDirectory}/test_stage.usdc"
+        try:
+            return_code, output = self.runSample(script, programPath, "-p", localStage)
             self.assertEqual(return_code, 0, output)
             self._checkStageContents(localStage, rectLightNames[0], domeLightNames[0])
-            shutil.rmtree("local_directory")
+        finally:
+            shutil.rmtree(localDirectory, ignore_errors=True)
 
-            # Test invalid options
-            return_code, output = utils.shell.run_shell_script(script, programPath, "-p", pathlib.Path(tempDir / "test_stage.usdc").as_posix(), "-a")
-            self.assertEqual(return_code, 2)
+        # Test invalid options
+        self.assertInvalidOptions(script, programPath, f"{tempDirStr}/test_stage.usdc")
 
     def testCppCreateLights(self):
         self._runSampleOptions("run", "createLights")
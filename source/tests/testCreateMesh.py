@@ -2,21 +2,25 @@
 # SPDX-License-Identifier: MIT
 #
 
-# Python built-in
-import pathlib
-import tempfile
-import unittest
-
 # Internal imports
 import common.sysUtils
 
 common.sysUtils.initEnvPaths()
 
 import utils.fileFormat
-import utils.shell
 from pxr import Usd, UsdGeom
 from utils.BaseTestCase import BaseTestCase
 
+# The stage file names, relative to the test directory, and the optional format argument for each sample run
+g_argsBasenames = (
+    ("test_stage.usdc", None),
+    ("test_stage.usda", None),
+    ("test_stage_binary.usd", None),
+    ("test_stage_text.usd", "--usda"),
+)
+# The expected mesh names after each successive run of the sample against the same stage
+g_meshNames = ("cubeMesh", "cubeMesh_1")
+
 
 class CreateMeshTestCase(BaseTestCase):
     # Test the createMesh program
@@ -27,7 +31,7 @@ class CreateMeshTestCase(BaseTestCase):
     # - it runs properly with or without an existing stage
 
     def _checkStageContents(self, stagePath, meshPrimName):
-        self.runAssetValidator(stagePath)
+        validator = self.startAssetValidator(stagePath)
 
         stage = Usd.Stage.Open(stagePath)
         self.assertTrue(stage)
@@ -40,34 +44,25 @@ class CreateMeshTestCase(BaseTestCase):
         self.assertTrue(prim)
         typedPrim = UsdGeom.Mesh(prim)
         self.assertTrue(typedPrim)
-        self.assertIsInstance(typedPrim, UsdGeom.Mesh)
+
+        self.waitAssetValidator(validator)
 
         stage = None
 
     def _runSampleOptions(self, script, programPath):
-        with tempfile.TemporaryDirectory() as tempDirStr:
-            tempDir = pathlib.Path(tempDirStr)
-            argsRuns = [
-                (pathlib.Path(tempDir / "test_stage.usdc").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage.usda").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage_binary.usd").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage_text.usd").as_posix(), "--usda"),
-            ]
-            meshNames = ["cubeMesh", "cubeMesh_1"]
+        tempDirStr = self.makeTempDir().as_posix()
+        argsRuns = [(f"{tempDirStr}/{basename}", flag) for basename, flag in g_argsBasenames]
 
+        # The stages are written concurrently, and each run is checked before the next run adds to them
+        for meshName in g_meshNames:
+            self.runSampleOnStages(script, programPath, argsRuns)
             for args in argsRuns:
-                for meshName in meshNames:
-                    if args[1]:
-                        return_code, output = utils.shell.run_shell_script(script, programPath, "-p", args[0], args[1])
-                    else:
-                        return_code, output = utils.shell.run_shell_script(script, programPath, "-p", args[0])
-                    self.assertEqual(return_code, 0, output)
-                    self._checkStageContents(args[0], meshName)
-                    utils.fileFormat.checkLayerFormat(self, args[0], args[1])
-
-            # Test invalid options
-            return_code, output = utils.shell.run_shell_script(script, programPath, "-p", pathlib.Path(tempDir / "test_stage.usdc").as_posix(), "-a")
-            self.assertEqual(return_code, 2)
+                self._checkStageContents(args[0], meshName)
+        for args in argsRuns:
+            utils.fileFormat.checkLayerFormat(self, args[0], args[1])
+
+        # Test invalid options
+        self.assertInvalidOptions(script, programPath, f"{tempDirStr}/test_stage.usdc")
 
     def testCppCreateMesh(self):
         self._runSampleOptions("run", "createMesh")
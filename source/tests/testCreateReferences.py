@@ -3,10 +3,9 @@
 #
 
 # Python built-in
+import os
 import pathlib
 import shutil
-import tempfile
-import unittest
 
 # Internal imports
 import common.sysUtils
@@ -15,43 +14,55 @@ common.sysUtils.initEnvPaths()
 
 import usdex.core
 import utils.fileFormat
-import utils.shell
-from pxr import Gf, Sdf, Usd, UsdGeom
+from pxr import Gf, UsdGeom
 from utils.BaseTestCase import BaseTestCase
 
 
 class CreateReferencesTestCase(BaseTestCase):
     def _checkStageContents(self, stagePath, refPrimName, payloadPrimName):
-        self.runAssetValidator(stagePath)
+        validator = self.startAssetValidator(stagePath)
 
-        stage = Usd.Stage.Open(stagePath)
+        stage = self.openStage(stagePath)
         self.assertTrue(stage)
 
         defaultPrim = stage.GetDefaultPrim()
         self.assertTrue(defaultPrim)
+        defaultPrimPath = defaultPrim.GetPath()
+        rootLayer = stage.GetRootLayer()
+        stageDir = pathlib.Path(stagePath).parent
 
         # check that the reference prim is present
-        refPrim = stage.GetPrimAtPath(defaultPrim.GetPath().AppendChild(refPrimName))
-        self.assertTrue(refPrim)
-        typedPrim = UsdGeom.Xform(refPrim)
-        self.assertTrue(typedPrim)
-        self.assertIsInstance(typedPrim, UsdGeom.Xform)
+        refPrim = self.assertPrimIsA(stage, defaultPrimPath.AppendChild(refPrimName), UsdGeom.Xform).GetPrim()
         translation, pivot, rotation, rotationOrder, scale = usdex.core.getLocalTransformComponents(refPrim)
         self.assertNotEqual(translation, Gf.Vec3d(0))
 
         # check the reference info
-        refPrimSpec = stage.GetRootLayer().GetPrimAtPath(refPrim.GetPath())
+        refPrimSpec = rootLayer.GetPrimAtPath(refPrim.GetPath())
         referencesInfo = refPrimSpec.GetInfo("references")
         self.assertEqual(len(referencesInfo.prependedItems), 1)
 
         # check that the reference stage is present
-        componentStageName = referencesInfo.prependedItems[0].assetPath
-        stageDir = pathlib.Path(stagePath).parent
-        componentStagePath = stageDir / componentStageName
-        self.assertTrue(componentStagePath.exists())
+        refComponentName = referencesInfo.prependedItems[0].assetPath
+        refComponentPath = stageDir / refComponentName
+        self.assertTrue(refComponentPath.exists())
 
-        # open the reference stage
-        refStage = Usd.Stage.Open(componentStagePath.as_posix())
+        # check that the payload prim is present
+        payloadPrim = self.assertPrimIsA(stage, defaultPrimPath.AppendChild(payloadPrimName), UsdGeom.Xform).GetPrim()
+        translation, pivot, rotation, rotationOrder, scale = usdex.core.getLocalTransformComponents(payloadPrim)
+        self.assertNotEqual(translation, Gf.Vec3d(0))
+
+        # check the payload info
+        payloadPrimSpec = rootLayer.GetPrimAtPath(payloadPrim.GetPath())
+        payloadsInfo = payloadPrimSpec.GetInfo("payload")
+        self.assertEqual(len(payloadsInfo.prependedItems), 1)
+
+        # check that the payload stage is present
+        payloadComponentName = payloadsInfo.prependedItems[0].assetPath
+        payloadComponentPath = stageDir / payloadComponentName
+        self.assertTrue(payloadComponentPath.exists())
+
+        # open the reference stage, the component stages are only opened once the checks of the stage itself have passed
+        refStage = self.openStage(refComponentPath.as_posix())
         self.assertTrue(refStage)
 
         # check for the layer comment
@@ -67,28 +78,8 @@ class CreateReferencesTestCase(BaseTestCase):
         self.assertNotEqual(inComponentTransform.GetScale(), inStageTransform.GetScale())
         refStage = None
 
-        # check that the payload prim is present
-        payloadPrim = stage.GetPrimAtPath(defaultPrim.GetPath().AppendChild(payloadPrimName))
-        self.assertTrue(payloadPrim)
-        typedPrim = UsdGeom.Xform(payloadPrim)
-        self.assertTrue(typedPrim)
-        self.assertIsInstance(typedPrim, UsdGeom.Xform)
-        translation, pivot, rotation, rotationOrder, scale = usdex.core.getLocalTransformComponents(payloadPrim)
-        self.assertNotEqual(translation, Gf.Vec3d(0))
-
-        # check the payload info
-        payloadPrimSpec = stage.GetRootLayer().GetPrimAtPath(payloadPrim.GetPath())
-        payloadsInfo = payloadPrimSpec.GetInfo("payload")
-        self.assertEqual(len(payloadsInfo.prependedItems), 1)
-
-        # check that the reference stage is present
-        componentStageName = payloadsInfo.prependedItems[0].assetPath
-        stageDir = pathlib.Path(stagePath).parent
-        componentStagePath = stageDir / componentStageName
-        self.assertTrue(componentStagePath.exists())
-
         # open the payload stage
-        payloadStage = Usd.Stage.Open(componentStagePath.as_posix())
+        payloadStage = self.openStage(payloadComponentPath.as_posix())
         self.assertTrue(payloadStage)
 
         # check for the layer comment
@@ -107,50 +98,60 @@ class CreateReferencesTestCase(BaseTestCase):
             inStageColorData = usdex.core.Vec3fPrimvarData.getPrimvarData(primvar)
             self.assertEqual(inStageColorData.interpolation(), UsdGeom.Tokens.constant)
         self.assertNotEqual(inStageColorData.values(), inComponentColorData.values())
+
+        self.waitAssetValidator(validator)
+
         payloadStage = None
         stage = None
 
     def _runSampleOptions(self, script, programPath):
-        with tempfile.TemporaryDirectory() as tempDirStr:
-            tempDir = pathlib.Path(tempDirStr)
-            argsRuns = [
-                (pathlib.Path(tempDir / "test_stage.usdc").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage.usda").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage_binary.usd").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage_text.usd").as_posix(), "--usda"),
-            ]
-            refNames = ["referencePrim", "referencePrim_1"]
-            payloadNames = ["payloadPrim", "payloadPrim_1"]
-
-            for args in argsRuns:
-                for idx in range(len(refNames)):
-                    if args[1]:
-                        return_code, output = utils.shell.run_shell_script(script, programPath, "-p", args[0], args[1])
-                    else:
-                        return_code, output = utils.shell.run_shell_script(script, programPath, "-p", args[0])
-
-                    self.assertEqual(return_code, 0, output)
-                    self._checkStageContents(args[0], refNames[idx], payloadNames[idx])
-                    utils.fileFormat.checkLayerFormat(self, args[0], args[1])
-
-            # Test relative path calculation in the program.  These pollute the repo, but they clean up after themselves
-            localStage = "local_test_stage.usdc"
-            cubeStage = "Cube_2x2x2.usdc"
-            return_code, output = utils.shell.run_shell_script(script, programPath, "-p", localStage)
+        tempDir = self.makeTempDir()
+        # Each stage gets its own directory so the concurrent runs don't write the component stages over each other
+        stageNames = [
+            ("usdc/test_stage.usdc", None),
+            ("usda/test_stage.usda", None),
+            ("binary/test_stage_binary.usd", None),
+            ("text/test_stage_text.usd", "--usda"),
+        ]
+        argsRuns = [((tempDir / name).as_posix(), flag) for name, flag in stageNames]
+        refNames = ["referencePrim", "referencePrim_1"]
+        payloadNames = ["payloadPrim", "payloadPrim_1"]
+
+        # The sample adds one reference and one payload per run. The stages are written concurrently, and each run is checked
+        # before the next run adds to them
+        for refName, payloadName in zip(refNames, payloadNames):
+            self.runSampleOnStages(script, programPath, argsRuns)
+            for stagePath, flag in argsRuns:
+                self._checkStageContents(stagePath, refName, payloadName)
+        for stagePath, flag in argsRuns:
+            utils.fileFormat.checkLayerFormat(self, stagePath, flag)
+
+        # Test relative path calculation in the program.  These pollute the repo, but they clean up after themselves, even on failure
+        # The stage and directory names include the process id so that concurrent test processes don't collide
+        localDirectory = f"local_directory_{os.getpid()}"
+        localStage = f"local_test_stage_{os.getpid()}.usdc"
+        cubeStage = "Cube_2x2x2.usdc"
+        try:
+            return_code, output = self.runSample(script, programPath, "-p", localStage)
             self.assertEqual(return_code, 0, output)
             self._checkStageContents(localStage, refNames[0], payloadNames[0])
-            pathlib.Path.unlink(pathlib.Path(localStage))
-            pathlib.Path.unlink(pathlib.Path(cubeStage))
-
-            localStage = "local_directory/test_stage.usdc"
-            return_code, output = utils.shell.run_shell_script(script, programPath, "-p", localStage)
+        finally:
+            self.closeStages()
+            for path in (localStage, cubeStage):
+                if os.path.exists(path):
+                    os.unlink(path)
+
+        localStage = f"{localDirectory}/test_stage.usdc"
+        try:
+            return_code, output = self.runSample(script, programPath, "-p", localStage)
             self.assertEqual(return_code, 0, output)
             self._checkStageContents(localStage, refNames[0], payloadNames[0])
-            shutil.rmtree("local_directory")
+        finally:
+            self.closeStages()
+            shutil.rmtree(localDirectory, ignore_errors=True)
 
-            # Test invalid options
-            return_code, output = utils.shell.run_shell_script(script, programPath, "-p", pathlib.Path(tempDir / "test_stage.usdc").as_posix(), "-a")
-            self.assertEqual(return_code, 2)
+        # Test invalid options
+        self.assertInvalidOptions(script, programPath, (tempDir / "test_stage.usdc").as_posix())
 
     def testCppCreateReferences(self):
         self._runSampleOptions("run", "createReferences")
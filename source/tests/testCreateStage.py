@@ -6,7 +6,6 @@
 import pathlib
 import shutil
 import tempfile
-import unittest
 
 # Internal imports
 import common.sysUtils
@@ -14,17 +13,16 @@ import common.sysUtils
 common.sysUtils.initEnvPaths()
 
 import utils.fileFormat
-import utils.shell
-from pxr import Usd, UsdGeom, UsdLux
+from pxr import UsdGeom, UsdLux
 from utils.BaseTestCase import BaseTestCase
 from utils.ScopedEnvVar import ScopedEnvVar
 
 
 class CreateStageTestCase(BaseTestCase):
     def _checkStageContents(self, stagePath, textFlag):
-        self.runAssetValidator(stagePath)
+        validator = self.startAssetValidator(stagePath)
 
-        stage = Usd.Stage.Open(stagePath)
+        stage = self.openStage(stagePath)
         self.assertTrue(stage)
 
         defaultPrim = stage.GetDefaultPrim()
@@ -32,62 +30,54 @@ class CreateStageTestCase(BaseTestCase):
         self.assertEqual("World", defaultPrim.GetName())
 
         # Check the cube
-        prim = stage.GetPrimAtPath(defaultPrim.GetPath().AppendChild("cube"))
-        self.assertTrue(prim)
-        typedPrim = UsdGeom.Cube(prim)
-        self.assertTrue(typedPrim)
-        self.assertIsInstance(typedPrim, UsdGeom.Cube)
+        self.assertPrimIsA(stage, defaultPrim.GetPath().AppendChild("cube"), UsdGeom.Cube)
 
         # Check the light
-        prim = stage.GetPrimAtPath(defaultPrim.GetPath().AppendChild("distantLight"))
-        self.assertTrue(prim)
-        typedPrim = UsdLux.DistantLight(prim)
-        self.assertTrue(typedPrim)
-        self.assertIsInstance(typedPrim, UsdLux.DistantLight)
+        self.assertPrimIsA(stage, defaultPrim.GetPath().AppendChild("distantLight"), UsdLux.DistantLight)
+
+        self.waitAssetValidator(validator)
 
         stage = None
 
     def _runSampleOptions(self, script, programPath):
-        with tempfile.TemporaryDirectory() as tempDirStr:
-            tempDir = pathlib.Path(tempDirStr)
-            argsRuns = [
-                (pathlib.Path(tempDir / "test_stage.usdc").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage.usda").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage.usd").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage.usd").as_posix(), "--usda"),
-            ]
-
-            for args in argsRuns:
-                if args[1]:
-                    return_code, output = utils.shell.run_shell_script(script, programPath, "-p", args[0], args[1])
-                else:
-                    return_code, output = utils.shell.run_shell_script(script, programPath, "-p", args[0])
-                self.assertEqual(return_code, 0, output)
-                self._checkStageContents(args[0], args[1])
-                utils.fileFormat.checkLayerFormat(self, args[0], args[1])
-
-            # Test default options
-            # Override the TMPDIR env var on Linux to steer the USD C++ pxr::ArchGetTmpDir()
-            # to using the same temp dir as Python, only for this test
-            #  Linux C++ temp directory (from USD fileSystem): /var/tmp
-            #  Linux Python temp directory: /tmp
-            with ScopedEnvVar("TMPDIR", tempfile.gettempdir(), ["Linux"]):
-                defaultStagePath = common.sysUtils.getDefaultStagePath(".usdc")
-                defaultStageDir = pathlib.Path(defaultStagePath).parent
-                return_code, output = utils.shell.run_shell_script(script, programPath)
-                self.assertEqual(return_code, 0, output)
-                self._checkStageContents(defaultStagePath, None)
-                shutil.rmtree(defaultStageDir)
-
-                defaultStagePath = common.sysUtils.getDefaultStagePath(".usda")
-                return_code, output = utils.shell.run_shell_script(script, programPath, "--usda")
-                self.assertEqual(return_code, 0, output)
-                self._checkStageContents(defaultStagePath, "--usda")
-                shutil.rmtree(defaultStageDir)
-
-            # Test invalid options
-            return_code, output = utils.shell.run_shell_script(script, programPath, "-p", pathlib.Path(tempDir / "test_stage.usdc").as_posix(), "-a")
-            self.assertEqual(return_code, 2)
+        tempDirStr = self.makeTempDir().as_posix()
+        argsRuns = [
+            (f"{tempDirStr}/test_stage.usdc", None),
+            (f"{tempDirStr}/test_stage.usda", None),
+            (f"{tempDirStr}/test_stage_binary.usd", None),
+            (f"{tempDirStr}/test_stage_text.usd", "--usda"),
+        ]
+
+        # Each stage is written by its own job, so the runs can overlap
+        self.runSampleOnStages(script, programPath, argsRuns)
+
+        for args in argsRuns:
+            self._checkStageContents(args[0], args[1])
+            utils.fileFormat.checkLayerFormat(self, args[0], args[1])
+
+        # Test default options
+        # Override the TMPDIR env var on Linux to steer the USD C++ pxr::ArchGetTmpDir()
+        # to using the same temp dir as Python, only for this test
+        #  Linux C++ temp directory (from USD fileSystem): /var/tmp
+        #  Linux Python temp directory: /tmp
+        with ScopedEnvVar("TMPDIR", tempfile.gettempdir(), ["Linux"]):
+            defaultStagePath = common.sysUtils.getDefaultStagePath(".usdc")
+            defaultStageDir = pathlib.Path(defaultStagePath).parent
+            return_code, output = self.runSample(script, programPath)
+            self.assertEqual(return_code, 0, output)
+            self._checkStageContents(defaultStagePath, None)
+            self.closeStages()
+            shutil.rmtree(defaultStageDir)
+
+            defaultStagePath = common.sysUtils.getDefaultStagePath(".usda")
+            return_code, output = self.runSample(script, programPath, "--usda")
+            self.assertEqual(return_code, 0, output)
+            self._checkStageContents(defaultStagePath, "--usda")
+            self.closeStages()
+            shutil.rmtree(defaultStageDir)
+
+        # Test invalid options
+        self.assertInvalidOptions(script, programPath, f"{tempDirStr}/test_stage.usdc")
 
     def testCppCreateStage(self):
         self._runSampleOptions("run", "createStage")
@@ -2,11 +2,6 @@
 # SPDX-License-Identifier: MIT
 #
 
-# Python built-in
-import pathlib
-import tempfile
-import unittest
-
 # Internal imports
 import common.sysUtils
 
@@ -14,77 +9,65 @@ common.sysUtils.initEnvPaths()
 
 import usdex.core
 import utils.fileFormat
-import utils.shell
-from pxr import Gf, Usd, UsdGeom
+from pxr import Gf, UsdGeom
 from utils.BaseTestCase import BaseTestCase
 
 
 class CreateTransformsTestCase(BaseTestCase):
     def _checkStageContents(self, stagePath, cubeName, xformName, groundName):
-        self.runAssetValidator(stagePath)
+        validator = self.startAssetValidator(stagePath)
 
-        stage = Usd.Stage.Open(stagePath)
+        stage = self.openStage(stagePath)
         self.assertTrue(stage)
 
         defaultPrim = stage.GetDefaultPrim()
         self.assertTrue(defaultPrim)
 
         # Check the cube
-        prim = stage.GetPrimAtPath(defaultPrim.GetPath().AppendChild(cubeName))
-        self.assertTrue(prim)
-        typedPrim = UsdGeom.Cube(prim)
-        self.assertTrue(typedPrim)
-        self.assertIsInstance(typedPrim, UsdGeom.Cube)
+        typedPrim = self.assertPrimIsA(stage, defaultPrim.GetPath().AppendChild(cubeName), UsdGeom.Cube)
+        prim = typedPrim.GetPrim()
         translation, pivot, rotation, rotationOrder, scale = usdex.core.getLocalTransformComponents(prim)
         self.assertNotEqual(rotation, Gf.Vec3f(0))
 
         # Check the xform
-        prim = stage.GetPrimAtPath(defaultPrim.GetPath().AppendChild(xformName))
-        self.assertTrue(prim)
-        typedPrim = UsdGeom.Xform(prim)
-        self.assertTrue(typedPrim)
-        self.assertIsInstance(typedPrim, UsdGeom.Xform)
+        typedPrim = self.assertPrimIsA(stage, defaultPrim.GetPath().AppendChild(xformName), UsdGeom.Xform)
+        prim = typedPrim.GetPrim()
         translation, pivot, rotation, rotationOrder, scale = usdex.core.getLocalTransformComponents(prim)
         self.assertAlmostEqual(translation, Gf.Vec3f(0, -55, 0))
 
         # check the ground cube under the xform prim
-        prim = stage.GetPrimAtPath(prim.GetPath().AppendChild(groundName))
-        self.assertTrue(prim)
-        typedPrim = UsdGeom.Cube(prim)
-        self.assertTrue(typedPrim)
-        self.assertIsInstance(typedPrim, UsdGeom.Cube)
+        typedPrim = self.assertPrimIsA(stage, prim.GetPath().AppendChild(groundName), UsdGeom.Cube)
+        prim = typedPrim.GetPrim()
         translation, pivot, rotation, rotationOrder, scale = usdex.core.getLocalTransformComponents(prim)
         self.assertAlmostEqual(scale, Gf.Vec3f(20, 0.1, 20))
 
+        self.waitAssetValidator(validator)
+
         stage = None
 
     def _runSampleOptions(self, script, programPath):
-        with tempfile.TemporaryDirectory() as tempDirStr:
-            tempDir = pathlib.Path(tempDirStr)
-            argsRuns = [
-                (pathlib.Path(tempDir / "test_stage.usdc").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage.usda").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage_binary.usd").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage_text.usd").as_posix(), "--usda"),
-            ]
-            cubeNames = ["cube", "cube"]
-            xformNames = ["groundXform", "groundXform_1"]
-            groundNames = ["groundCube", "groundCube"]
-
-            for args in argsRuns:
-                for idx in range(len(cubeNames)):
-                    if args[1]:
-                        return_code, output = utils.shell.run_shell_script(script, programPath, "-p", args[0], args[1])
-                    else:
-                        return_code, output = utils.shell.run_shell_script(script, programPath, "-p", args[0])
-
-                    self.assertEqual(return_code, 0, output)
-                    self._checkStageContents(args[0], cubeNames[idx], xformNames[idx], groundNames[idx])
-                    utils.fileFormat.checkLayerFormat(self, args[0], args[1])
-
-            # Test invalid options
-            return_code, output = utils.shell.run_shell_script(script, programPath, "-p", pathlib.Path(tempDir / "test_stage.usdc").as_posix(), "-a")
-            self.assertEqual(return_code, 2)
+        tempDir = self.makeTempDir()
+        stageNames = [
+            ("test_stage.usdc", None),
+            ("test_stage.usda", None),
+            ("test_stage_binary.usd", None),
+            ("test_stage_text.usd", "--usda"),
+        ]
+        argsRuns = [((tempDir / name).as_posix(), flag) for name, flag in stageNames]
+        cubeNames = ["cube", "cube"]
+        xformNames = ["groundXform", "groundXform_1"]
+        groundNames = ["groundCube", "groundCube"]
+
+        # The stages are written concurrently, and each run is checked before the next run adds to them
+        for cubeName, xformName, groundName in zip(cubeNames, xformNames, groundNames):
+            self.runSampleOnStages(script, programPath, argsRuns)
+            for stagePath, flag in argsRuns:
+                self._checkStageContents(stagePath, cubeName, xformName, groundName)
+        for stagePath, flag in argsRuns:
+            utils.fileFormat.checkLayerFormat(self, stagePath, flag)
+
+        # Test invalid options
+        self.assertInvalidOptions(script, programPath, (tempDir / "test_stage.usdc").as_posix())
 
     def testCppCreateTransforms(self):
         self._runSampleOptions("run", "createTransforms")
@@ -17,28 +17,31 @@ import utils.shell
 from utils.ScopedEnvVar import ScopedEnvVar
 
 
+g_samples = [
+    "createStage",
+    "createCameras",
+    "createLights",
+    "createMaterials",
+    "createMesh",
+    "createReferences",
+    "createSkeleton",
+    "createTransforms",
+    "setDisplayNames",
+]
+
+
 class RunAllTestCase(unittest.TestCase):
-    def _loopSamples(self, script, stagePath):
-        samples = [
-            "createStage",
-            "createCameras",
-            "createLights",
-            "createMaterials",
-            "createMesh",
-            "createReferences",
-            "createSkeleton",
-            "createTransforms",
-            "setDisplayNames",
-        ]
+    def _sampleProgram(self, script, sample):
+        if "run" in script:
+            return sample
+        sampleScript = sample + ".py"
+        source = pathlib.Path("source")
+        return (source / sample / sampleScript).as_posix()
 
-        for sample in samples:
-            if "run" in script:
-                program = sample
-            else:
-                sampleScript = sample + ".py"
-                source = pathlib.Path("source")
-                program = pathlib.Path(source / sample / sampleScript).as_posix()
-            return_code, output = utils.shell.run_shell_script(script, program, "-p", stagePath)
+    def _loopSamples(self, script, stagePath):
+        # Run every sample in turn against a single stage, checking that they all author onto one shared stage
+        for sample in g_samples:
+            return_code, output = utils.shell.run_shell_script(script, self._sampleProgram(script, sample), "-p", stagePath)
             self.assertEqual(return_code, 0, output)
 
     def testRunAllCpp(self):
@@ -48,8 +51,7 @@ class RunAllTestCase(unittest.TestCase):
             self._loopSamples("run", stagePath)
         else:
             with tempfile.TemporaryDirectory() as tempDirStr:
-                tempDir = pathlib.Path(tempDirStr)
-                stagePath = pathlib.Path(tempDir / "test_stage.usdc").as_posix()
+                stagePath = (pathlib.Path(tempDirStr) / "test_stage.usdc").as_posix()
                 self._loopSamples("run", stagePath)
 
     def testRunAllPython(self):
@@ -60,6 +62,5 @@ class RunAllTestCase(unittest.TestCase):
                 self._loopSamples("python", stagePath)
             else:
                 with tempfile.TemporaryDirectory() as tempDirStr:
-                    tempDir = pathlib.Path(tempDirStr)
-                    stagePath = pathlib.Path(tempDir / "test_stage.usdc").as_posix()
+                    stagePath = (pathlib.Path(tempDirStr) / "test_stage.usdc").as_posix()
                     self._loopSamples("python", stagePath)
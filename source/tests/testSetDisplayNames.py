@@ -2,11 +2,6 @@
 # SPDX-License-Identifier: MIT
 #
 
-# Python built-in
-import pathlib
-import tempfile
-import unittest
-
 # Internal imports
 import common.sysUtils
 
@@ -14,65 +9,62 @@ common.sysUtils.initEnvPaths()
 
 import usdex.core
 import utils.fileFormat
-import utils.shell
-from pxr import Gf, Usd, UsdGeom
+from pxr import Gf, UsdGeom
 from utils.BaseTestCase import BaseTestCase
 from utils.ScopedEnvVar import ScopedEnvVar
 
 
 class SetDisplayNamesTestCase(BaseTestCase):
-    def _checkStageContents(self, stagePath, primName):
-        self.runAssetValidator(stagePath)
+    def _checkStageContents(self, stagePath, primNames):
+        validator = self.startAssetValidator(stagePath)
 
-        stage = Usd.Stage.Open(stagePath)
+        stage = self.openStage(stagePath)
         self.assertTrue(stage)
 
         defaultPrim = stage.GetDefaultPrim()
         self.assertTrue(defaultPrim)
 
-        # Check the xform
-        prim = stage.GetPrimAtPath(defaultPrim.GetPath().AppendChild(primName))
-        self.assertTrue(prim)
-        typedPrim = UsdGeom.Xform(prim)
-        self.assertTrue(typedPrim)
-        self.assertIsInstance(typedPrim, UsdGeom.Xform)
-        translation, pivot, rotation, rotationOrder, scale = usdex.core.getLocalTransformComponents(prim)
-        self.assertNotEqual(translation, Gf.Vec3f(0))
-        displayName = usdex.core.computeEffectiveDisplayName(prim)
-        self.assertEqual(displayName, "🚀")
-
-        self.assertEqual(len(prim.GetChildren()), 4)
         displayChars = ["⛽", "👃", "🦈", "🦈"]
-        for idx, child in enumerate(prim.GetChildren()):
-            self.assertTrue(displayChars[idx] in usdex.core.computeEffectiveDisplayName(child))
+        for primName in primNames:
+            with self.subTest(prim=primName):
+                # Check the xform
+                typedPrim = self.assertPrimIsA(stage, defaultPrim.GetPath().AppendChild(primName), UsdGeom.Xform)
+                prim = typedPrim.GetPrim()
+                translation, pivot, rotation, rotationOrder, scale = usdex.core.getLocalTransformComponents(prim)
+                self.assertNotEqual(translation, Gf.Vec3f(0))
+                displayName = usdex.core.computeEffectiveDisplayName(prim)
+                self.assertEqual(displayName, "🚀")
+
+                children = prim.GetChildren()
+                self.assertEqual(len(children), 4)
+                for displayChar, child in zip(displayChars, children, strict=True):
+                    self.assertIn(displayChar, usdex.core.computeEffectiveDisplayName(child))
+
+        self.waitAssetValidator(validator)
 
         stage = None
 
     def _runSampleOptions(self, script, programPath):
-        with tempfile.TemporaryDirectory() as tempDirStr:
-            tempDir = pathlib.Path(tempDirStr)
-            argsRuns = [
-                (pathlib.Path(tempDir / "test_stage.usdc").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage.usda").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage_binary.usd").as_posix(), None),
-                (pathlib.Path(tempDir / "test_stage_text.usd").as_posix(), "--usda"),
-            ]
-            primNames = ["rocket", "rocket_1"]
-
-            for args in argsRuns:
-                for idx in range(len(primNames)):
-                    if args[1]:
-                        return_code, output = utils.shell.run_shell_script(script, programPath, "-p", args[0], args[1])
-                    else:
-                        return_code, output = utils.shell.run_shell_script(script, programPath, "-p", args[0])
-
-                    self.assertEqual(return_code, 0, output)
-                    self._checkStageContents(args[0], primNames[idx])
-                    utils.fileFormat.checkLayerFormat(self, args[0], args[1])
-
-            # Test invalid options
-            return_code, output = utils.shell.run_shell_script(script, programPath, "-p", pathlib.Path(tempDir / "test_stage.usdc").as_posix(), "-a")
-            self.assertEqual(return_code, 2)
+        tempDirStr = self.makeTempDir().as_posix()
+        argsRuns = [
+            (f"{tempDirStr}/test_stage.usdc", None),
+            (f"{tempDirStr}/test_stage.usda", None),
+            (f"{tempDirStr}/test_stage_binary.usd", None),
+            (f"{tempDirStr}/test_stage_text.usd", "--usda"),
+        ]
+        primNames = ["rocket", "rocket_1"]
+
+        # The stages are written concurrently, and each run is checked before the next run adds to them
+        for primName in primNames:
+            self.runSampleOnStages(script, programPath, argsRuns)
+            for stagePath, flag in argsRuns:
+                with self.subTest(stagePath=stagePath):
+                    self._checkStageContents(stagePath, [primName])
+        for stagePath, flag in argsRuns:
+            utils.fileFormat.checkLayerFormat(self, stagePath, flag)
+
+        # Test invalid options
+        self.assertInvalidOptions(script, programPath, f"{tempDirStr}/test_stage.usdc")
 
     def testCppSetDisplayNames(self):
         self._runSampleOptions("run", "setDisplayNames")
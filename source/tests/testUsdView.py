@@ -15,7 +15,7 @@ class UsdViewTestCase(unittest.TestCase):
     def testUsdView(self):
         with tempfile.TemporaryDirectory() as tempDirStr:
             tempDir = pathlib.Path(tempDirStr)
-            stagePath = pathlib.Path(tempDir / "test_stage.usdc").as_posix()
+            stagePath = (tempDir / "test_stage.usdc").as_posix()
             return_code, output = utils.shell.run_shell_script("run", "createStage", "-p", stagePath)
             self.assertEqual(return_code, 0, output)
 
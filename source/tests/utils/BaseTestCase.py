@@ -3,40 +3,255 @@
 #
 
 # Python built-in
+import argparse
+import contextlib
 import difflib
-import filecmp
+import hashlib
+import io
+import mmap
+import os
 import pathlib
+import re
+import sys
 import tempfile
 import unittest
 
 # Internal imports
+import common.commandLine
 import utils.shell
+from pxr import Usd
+
+
+# An asset validator output line reporting an issue, matched case insensitively at the start of the line
+g_validatorIssuePattern = re.compile("warning|error|fatal", re.IGNORECASE)
+
+# The sample output is only reported when a run fails, so the tail of a chatty run is enough to diagnose it
+g_maxSampleOutputLines = 1024
+
+
+def _filesEqual(pathA, pathB):
+    # Compare the file contents in place through memory maps, rather than reading them into Python objects
+    with open(pathA, "rb") as fileA, open(pathB, "rb") as fileB:
+        size = os.fstat(fileA.fileno()).st_size
+        if size != os.fstat(fileB.fileno()).st_size:
+            return False
+        if size == 0:
+            return True
+        with mmap.mmap(fileA.fileno(), 0, access=mmap.ACCESS_READ) as mapA, mmap.mmap(fileB.fileno(), 0, access=mmap.ACCESS_READ) as mapB:
+            with memoryview(mapA) as viewA, memoryview(mapB) as viewB:
+                return viewA == viewB
 
 
 class BaseTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # A single scratch directory per test class, see makeTempDir()
+        cls._classTempDir = tempfile.TemporaryDirectory()
+        cls.tempDir = pathlib.Path(cls._classTempDir.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._classTempDir.cleanup()
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+        # Stages opened by openStage(), keyed by path, with the file modification time and size they were read at
+        self._stageCache = dict()
+        # (stage path, content digest) pairs that have passed the asset validator during this test. This is not kept across
+        # tests, because a byte-identical stage may sit next to different external files, such as recopied textures
+        self._validatedStages = set()
+
+    def tearDown(self):
+        self.closeStages()
+        super().tearDown()
+
+    def openStage(self, stagePath):
+        """
+        Open a stage for inspection, reusing the stage from an earlier call while the file on disk is unchanged
+
+        If the file has been rewritten since it was opened, the cached stage is reloaded. Reopening it would return the
+        stale layer that is still registered by the cached stage.
+
+        Args:
+            stagePath: The path to the stage
+
+        Returns: The opened stage
+        """
+        stat = os.stat(stagePath)
+        fileKey = (stat.st_mtime_ns, stat.st_size)
+        cached = self._stageCache.get(stagePath)
+        if cached is None:
+            stage = Usd.Stage.Open(stagePath)
+        else:
+            stage = cached[1]
+            if cached[0] != fileKey:
+                stage.Reload()
+        self._stageCache[stagePath] = (fileKey, stage)
+        return stage
+
+    def closeStages(self):
+        """
+        Release every stage opened by openStage(), so that their files may be modified or removed
+        """
+        self._stageCache.clear()
+
+    def assertPrimIsA(self, stage, path, schemaType):
+        """
+        Assert that a prim exists on a stage and is of a typed schema
+
+        Args:
+            stage: The stage to get the prim from
+            path: The path of the prim
+            schemaType: The typed schema class, for example `UsdGeom.Mesh`
+
+        Returns: The prim wrapped in the schema class
+        """
+        prim = stage.GetPrimAtPath(path)
+        self.assertTrue(prim, msg=f"{path} does not exist")
+        self.assertTrue(prim.IsA(schemaType), msg=f"{path} is not a {schemaType.__name__}")
+        return schemaType(prim)
+
+    def makeTempDir(self):
+        """
+        Create an empty directory for a single test within the test class scratch directory
+
+        Returns: The path to the new directory, which is removed along with the class scratch directory
+        """
+        return pathlib.Path(tempfile.mkdtemp(dir=self.tempDir))
+
+    def runSample(self, script, *argv):
+        """
+        Run a sample and return its return code and output
+
+        Args:
+            script: "run" for a C++ sample, "python" for a Python sample script, or the name of another wrapper script
+            argv: The sample name or script path followed by its command line arguments
+
+        Returns: A tuple of the return code and the combined stdout and stderr output
+        """
+        return utils.shell.run_shell_script(script, *argv, maxLines=g_maxSampleOutputLines)
+
+    def runSampleJobs(self, jobs):
+        """
+        Run independent sample jobs concurrently and assert that every run succeeded
+
+        Each job is a list of `runSample` argument tuples that are run in order, so repeated runs against the same stage
+        stay sequential. Jobs must not write to the same files. Every sample runs in its own subprocess, the jobs are
+        launched together and awaited with `utils.shell.run_shell_scripts`, and all assertions are made once they have
+        completed.
+
+        Args:
+            jobs: A list of jobs, each a list of `runSample` argument tuples
+        """
+        results = utils.shell.run_shell_scripts(jobs, maxLines=g_maxSampleOutputLines)
+        for jobResults in results:
+            for return_code, output in jobResults:
+                self.assertEqual(return_code, 0, output)
+
+    def runSampleOnStages(self, script, programPath, argsRuns):
+        """
+        Run a sample once against each of several stages concurrently and assert that every run succeeded
+
+        Each stage is written by its own job, so that the stages can be checked after every run before the next run adds
+        to them.
+
+        Args:
+            script: "run" for a C++ sample or "python" for a Python sample script
+            programPath: The sample name or script path
+            argsRuns: A list of `(stagePath, flag)` tuples, where flag is an optional extra argument such as "--usda"
+        """
+        # The samples rewrite the stage files, so release any stages that are still open on them first
+        self.closeStages()
+        self.runSampleJobs([[(script, programPath, "-p", stagePath) + ((flag,) if flag else ())] for stagePath, flag in argsRuns])
+
+    def assertInvalidOptions(self, script, programPath, stagePath):
+        """
+        Assert that a sample rejects --usda combined with a .usdc stage path
+
+        The C++ sample is run as a subprocess. Every Python sample parses its options with common.commandLine, so for
+        those the options are parsed in the test interpreter rather than starting a new interpreter only to reject them.
+
+        Args:
+            script: "run" for a C++ sample or "python" for a Python sample script
+            programPath: The sample name or script path
+            stagePath: A .usdc stage path, which is never written
+        """
+        if script != "python":
+            return_code, output = self.runSample(script, programPath, "-p", stagePath, "-a")
+            self.assertEqual(return_code, 2, output)
+            return
+
+        savedArgv = sys.argv
+        sys.argv = [programPath, "-p", stagePath, "-a"]
+        try:
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                with self.assertRaises(SystemExit) as context:
+                    common.commandLine.parseCommonOptions(argparse.ArgumentParser())
+        finally:
+            sys.argv = savedArgv
+        self.assertEqual(context.exception.code, 2)
+
     def compareTextOutput(self, cppName, pythonScript):
-        with tempfile.TemporaryDirectory() as tempDirStr:
-            tempDir = pathlib.Path(tempDirStr)
-            stagePaths = [pathlib.Path(tempDir / "test_stage_cpp.usda").as_posix(), pathlib.Path(tempDir / "test_stage_python.usda").as_posix()]
-            return_code, output = utils.shell.run_shell_script("run", cppName, "-p", stagePaths[0])
-            self.assertEqual(return_code, 0, output)
-            return_code, output = utils.shell.run_shell_script("python", pythonScript, "-p", stagePaths[1])
-            self.assertEqual(return_code, 0, output)
-
-            def printUsdFiles(files):
-                with open(files[0]) as cppFile:
-                    with open(files[1]) as pyFile:
-                        cppLines = cppFile.readlines()
-                        pyLines = pyFile.readlines()
-                        diffLines = difflib.unified_diff(cppLines, pyLines, fromfile=files[0], tofile=files[1])
-                        return "".join(diffLines)
-
-            filecmp.clear_cache()
-            self.assertTrue(filecmp.cmp(stagePaths[0], stagePaths[1]), msg=printUsdFiles(stagePaths))
+        tempDirStr = self.makeTempDir().as_posix()
+        stagePaths = [f"{tempDirStr}/test_stage_cpp.usda", f"{tempDirStr}/test_stage_python.usda"]
+        return_code, output = utils.shell.run_shell_script("run", cppName, "-p", stagePaths[0])
+        self.assertEqual(return_code, 0, output)
+        return_code, output = utils.shell.run_shell_script("python", pythonScript, "-p", stagePaths[1])
+        self.assertEqual(return_code, 0, output)
 
-    def runAssetValidator(self, stagePath):
-        return_code, output = utils.shell.run_shell_script("omni_asset_validator", stagePath)
+        def printUsdFiles(files):
+            with open(files[0]) as cppFile:
+                with open(files[1]) as pyFile:
+                    cppLines = cppFile.readlines()
+                    pyLines = pyFile.readlines()
+                    diffLines = difflib.unified_diff(cppLines, pyLines, fromfile=files[0], tofile=files[1])
+                    return "".join(diffLines)
+
+        # The diff is only built for the failure message, when the outputs differ
+        if not _filesEqual(stagePaths[0], stagePaths[1]):
+            self.fail(msg=printUsdFiles(stagePaths))
+
+    def startAssetValidator(self, stagePath):
+        """
+        Start the asset validator on a stage in the background, so that other checks can run while it works
+
+        The validator is stopped when the test finishes, if it has not been waited on by then.
+
+        Args:
+            stagePath: The path to the stage
+
+        Returns: A handle to pass to waitAssetValidator(), which is None if this stage content has already passed during this test
+        """
+        # Skip the validator subprocess if this exact stage content has already passed at this path during this test
+        with open(stagePath, "rb") as stageFile:
+            key = (os.path.abspath(stagePath), hashlib.blake2b(stageFile.read(), digest_size=16).hexdigest())
+        if key in self._validatedStages:
+            return None
+
+        process = utils.shell.start_shell_script("omni_asset_validator", stagePath)
+        self.addCleanup(utils.shell.stop_shell_script, process)
+        return key, process
+
+    def waitAssetValidator(self, validator):
+        """
+        Wait for an asset validator started by startAssetValidator() and fail on any reported issue
+
+        Args:
+            validator: The handle returned by startAssetValidator()
+        """
+        if validator is None:
+            return
+
+        key, process = validator
+        return_code, output = utils.shell.wait_shell_script(process)
         self.assertEqual(return_code, 0, output)
         for line in output.splitlines():
-            if line.lower().startswith("warning") or line.lower().startswith("error") or line.lower().startswith("fatal"):
+            if g_validatorIssuePattern.match(line):
                 self.fail(msg=line)
+
+        self._validatedStages.add(key)
+
+    def runAssetValidator(self, stagePath):
+        self.waitAssetValidator(self.startAssetValidator(stagePath))
@@ -6,6 +6,9 @@
 import os
 import platform
 
+# The platform never changes while the tests run
+g_system = platform.system()
+
 
 class ScopedEnvVar:
     """
@@ -21,20 +24,19 @@ class ScopedEnvVar:
             value (str): The value for the environment variable
             platforms (list[str]): A list of platforms from platform.system() where the env var will be set and restored ("Linux", "Windows")
         """
-        self.platforms = platforms
-        if platform.system() in self.platforms:
+        self.active = g_system in platforms
+        if self.active:
             self.envVar = envVar
             self.newValue = value
             self.prevValue = os.getenv(self.envVar)
 
     def __enter__(self):
-        if platform.system() in self.platforms:
+        if self.active:
             os.environ[self.envVar] = self.newValue
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if platform.system() in self.platforms:
-            if self.prevValue:
+        if self.active:
+            if self.prevValue is not None:
                 os.environ[self.envVar] = self.prevValue
             else:
                 del os.environ[self.envVar]
-        pass
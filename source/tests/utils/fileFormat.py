@@ -2,13 +2,13 @@
 # SPDX-License-Identifier: MIT
 #
 
-# USD imports
-from pxr import Sdf, Usd, UsdGeom, UsdLux
+# The leading bytes of each native layer file format
+g_layerFileMagic = {"usda": b"#usda ", "usdc": b"PXR-USDC"}
 
 
 def checkLayerFormat(testClass, stagePath, textFlag):
-    # Check the stage/layer file format/encoding
-    if ".usda" in stagePath or textFlag:
-        testClass.assertTrue(Sdf.FileFormat.FindById("usda").CanRead(stagePath))
-    else:
-        testClass.assertTrue(Sdf.FileFormat.FindById("usdc").CanRead(stagePath))
+    # Check the stage/layer file format/encoding by reading the header bytes of the file directly
+    formatId = "usda" if stagePath.endswith(".usda") or textFlag else "usdc"
+    with open(stagePath, "rb", buffering=0) as stageFile:
+        header = stageFile.read(8)
+    testClass.assertTrue(header.startswith(g_layerFileMagic[formatId]), msg=f"{stagePath} is not a {formatId} layer")
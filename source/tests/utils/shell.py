@@ -3,21 +3,120 @@
 #
 
 # Python built-in
+import asyncio
+import collections
 import os
 import platform
 import subprocess
 
 
+# The extension of the wrapper scripts on this platform, which never changes while the tests run
+g_shellExt = ".bat" if platform.system() == "Windows" else ".sh"
+
+
 def shell_ext():
-    if platform.system() == "Windows":
-        return ".bat"
-    else:
-        return ".sh"
-
-
-def run_shell_script(script, *argv):
-    cmdline = list()
-    cmdline.append(os.path.join(os.getcwd(), script + shell_ext()))
-    cmdline += argv
-    completed = subprocess.run(cmdline, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, encoding="utf-8")
-    return completed.returncode, completed.stdout
+    return g_shellExt
+
+
+# Leave file descriptors open in the child on POSIX, which lets subprocess use posix_spawn instead of fork and exec. Python
+# file descriptors are not inheritable by default, so the child only receives its standard streams either way
+g_spawnArgs = dict() if platform.system() == "Windows" else dict(close_fds=False)
+
+# The absolute path of each wrapper script, resolved against the working directory on first use
+g_scriptPaths = dict()
+
+
+def _shell_cmdline(script, *argv):
+    scriptPath = g_scriptPaths.get(script)
+    if scriptPath is None:
+        scriptPath = os.path.join(os.getcwd(), script + g_shellExt)
+        g_scriptPaths[script] = scriptPath
+    return [scriptPath, *argv]
+
+
+def run_shell_script(script, *argv, maxLines=None):
+    """
+    Run a shell script, streaming its output as it is produced
+
+    Args:
+        script: The name of the shell script, without its extension
+        argv: The command line arguments for the script
+        maxLines: Keep only this many of the last output lines, or all of them if None
+
+    Returns: A tuple of the return code and the combined stdout and stderr output
+    """
+    cmdline = _shell_cmdline(script, *argv)
+    with subprocess.Popen(cmdline, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, encoding="utf-8", **g_spawnArgs) as process:
+        output = collections.deque(process.stdout, maxlen=maxLines)
+    return process.returncode, "".join(output)
+
+
+def start_shell_script(script, *argv):
+    """
+    Start a shell script without waiting for it to finish
+
+    Args:
+        script: The name of the shell script, without its extension
+        argv: The command line arguments for the script
+
+    Returns: The running `subprocess.Popen`, to be passed to `wait_shell_script` or `stop_shell_script`
+    """
+    return subprocess.Popen(_shell_cmdline(script, *argv), stdout=subprocess.PIPE, stderr=subprocess.STDOUT, encoding="utf-8", **g_spawnArgs)
+
+
+def wait_shell_script(process):
+    """
+    Wait for a shell script started by `start_shell_script` to finish
+
+    Args:
+        process: The running script
+
+    Returns: A tuple of the return code and the combined stdout and stderr output
+    """
+    stdout, _ = process.communicate()
+    return process.returncode, stdout
+
+
+def stop_shell_script(process):
+    """
+    Terminate a shell script started by `start_shell_script` if it is still running
+
+    Args:
+        process: The script, which may already have been waited on
+    """
+    if process.returncode is None:
+        process.kill()
+        process.communicate()
+
+
+async def _run_shell_job(job, maxLines):
+    results = list()
+    for args in job:
+        process = await asyncio.create_subprocess_exec(
+            *_shell_cmdline(*args), stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT, **g_spawnArgs
+        )
+        output = collections.deque(maxlen=maxLines)
+        async for line in process.stdout:
+            output.append(line)
+        await process.wait()
+        results.append((process.returncode, b"".join(output).decode("utf-8").replace("\r\n", "\n")))
+    return results
+
+
+async def _run_shell_jobs(jobs, maxLines):
+    return await asyncio.gather(*[_run_shell_job(job, maxLines) for job in jobs])
+
+
+def run_shell_scripts(jobs, maxLines=None):
+    """
+    Run several jobs of shell scripts concurrently
+
+    The scripts within a job are run in order, while the jobs themselves are launched together and awaited as a batch.
+
+    Args:
+        jobs: A list of jobs, each a list of `run_shell_script` argument tuples
+        maxLines: Keep only this many of the last output lines of each script, or all of them if None
+
+    Returns: A list with the `(returncode, stdout)` tuples of each job, in the same order as `jobs`
+    """
+    return asyncio.run(_run_shell_jobs(jobs, maxLines))